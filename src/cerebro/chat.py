@@ -11,27 +11,45 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
 import shutil
 import uuid
 from contextlib import AsyncExitStack
 from datetime import datetime, timezone
-from pathlib import Path
+from functools import lru_cache
+from time import monotonic
 from typing import Any, List
 
+from langchain_core.messages import ToolMessage
 from textual import work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import ScrollableContainer
 from textual.widgets import Footer, Header, Input, Static
 
-from cerebro.context import Context as AgentContext  # passed to astream_events as context=
+from cerebro import mcp
+from cerebro.context import Context as AgentContext  # passed to astream as context=
 from cerebro.graph import create_graph
-from cerebro.tools import BASE_TOOLS
+from cerebro.tools import BASE_TOOLS, aclose_shared_session
+from cerebro.utils import DATA_DIR as _DATA_DIR
+from cerebro.utils import bounded_stream
 
 # Where chat history is stored
-_DATA_DIR = Path.home() / ".local" / "share" / "cerebro"
 _DB_PATH = _DATA_DIR / "chat.db"
 _THREAD_FILE = _DATA_DIR / "last_thread.txt"
+_TOOL_CACHE = _DATA_DIR / "mcp_tools.json"
+
+# Pre-bound for the per-token parsing loop in _send_message.
+_dict_get = dict.get
+
+# MCP server config for brain-mcp; also the cache key for the tool manifest.
+_MCP_SERVERS = {
+    "local-brain": {
+        "transport": "stdio",
+        "command": "brain-mcp",
+        "args": [],
+    }
+}
 
 
 # ---------------------------------------------------------------------------
@@ -61,29 +79,24 @@ class MessageWidget(Static):
         self._role = role
         self._content = content
         self._tool_calls: List[str] = []
+        # Header and tool block are invariant between tool events, so the
+        # per-token repaint path reduces to a three-part concatenation.
+        if role == "user":
+            self._header_block = "[bold #5bc0f8]You[/bold #5bc0f8]\n\n"
+        else:
+            self._header_block = "[bold #7bc67e]Cerebro[/bold #7bc67e]\n\n"
+        self._tool_block = ""
         super().__init__(self._build_markup(), **kwargs)
         self.add_class(role)
 
     def _build_markup(self, streaming: bool = False) -> str:
-        if self._role == "user":
-            header = "[bold #5bc0f8]You[/bold #5bc0f8]"
-        else:
-            header = "[bold #7bc67e]Cerebro[/bold #7bc67e]"
-
-        parts = [header, ""]
-
-        for tool in self._tool_calls:
-            parts.append(f"[dim]  ↳ {tool}[/dim]")
-
-        if self._tool_calls:
-            parts.append("")
-
         if self._content:
-            parts.append(self._content)
+            body = self._content
         elif streaming:
-            parts.append("[dim]thinking…[/dim]")
-
-        return "\n".join(parts)
+            body = "[dim]thinking…[/dim]"
+        else:
+            body = ""
+        return self._header_block + self._tool_block + body
 
     def set_content(
         self,
@@ -93,8 +106,12 @@ class MessageWidget(Static):
     ) -> None:
         """Update displayed content in-place (used during streaming)."""
         self._content = content
-        if tool_calls is not None:
-            self._tool_calls = tool_calls
+        if tool_calls is not None and len(tool_calls) != len(self._tool_calls):
+            self._tool_calls = list(tool_calls)
+            self._tool_block = (
+                "\n".join(f"[dim]  ↳ {tool}[/dim]" for tool in self._tool_calls)
+                + "\n\n"
+            )
         self.update(self._build_markup(streaming=streaming))
 
 
@@ -134,6 +151,11 @@ class ChatApp(App[None]):
         self._mcp_client: Any = None  # kept alive so connections aren't GC'd
         self.graph: Any = None
         self.thread_id: str = _daily_thread_id()
+        self._last_saved_thread_id: str | None = None
+        # Built once per session: constructing Context walks the env for
+        # overrides, which doesn't belong on the per-message path. Rebuild
+        # here if runtime model switching is ever added.
+        self._ctx = AgentContext()
 
     # ------------------------------------------------------------------
     # Layout
@@ -154,6 +176,7 @@ class ChatApp(App[None]):
         self._initialize()  # fire-and-forget worker
 
     async def on_unmount(self) -> None:
+        await aclose_shared_session()
         await self._exit_stack.aclose()
 
     @work(exclusive=True)
@@ -161,55 +184,67 @@ class ChatApp(App[None]):
         """Start MCP client and SQLite checkpointer, then compile the graph."""
         _DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-        tools = list(BASE_TOOLS)
-
-        # --- MCP tools (optional — graceful fallback if brain-mcp not found) ---
-        if shutil.which("brain-mcp"):
-            try:
-                from langchain_mcp_adapters.client import MultiServerMCPClient
-
-                # In langchain-mcp-adapters >= 0.1.0 the client is not a context
-                # manager; connections are established lazily on get_tools().
-                self._mcp_client = MultiServerMCPClient(
-                    {
-                        "local-brain": {
-                            "transport": "stdio",
-                            "command": "brain-mcp",
-                            "args": [],
-                        }
-                    }
-                )
-                mcp_tools = await self._mcp_client.get_tools()
-                tools = mcp_tools + tools
+        # MCP discovery and the SQLite open are independent I/O; run them
+        # concurrently so the database opens during the brain-mcp handshake
+        # instead of serially after it.
+        async with asyncio.TaskGroup() as tg:
+            mcp_task = tg.create_task(self._load_mcp_tools())
+            saver_task = tg.create_task(self._open_checkpointer())
+
+        tools = mcp_task.result() + list(BASE_TOOLS)
+        self.graph = create_graph(tools, checkpointer=saver_task.result())
+
+        # Focus the input now that we're ready
+        self.query_one("#input", Input).focus()
+
+    async def _load_mcp_tools(self) -> List[Any]:
+        """Load brain-mcp tools, or return [] if brain-mcp is unavailable."""
+        if not shutil.which("brain-mcp"):
+            self.notify(
+                "brain-mcp not found in PATH — running without brain tools",
+                severity="warning",
+                timeout=6,
+            )
+            return []
+
+        try:
+            proxy = mcp.LazyMCPProxy(_MCP_SERVERS, cache_path=_TOOL_CACHE)
+            self._mcp_client = proxy  # kept alive so connections aren't GC'd
+            cached_schemas = mcp.load_cached_schemas(_TOOL_CACHE, _MCP_SERVERS)
+            if cached_schemas is not None:
+                # Warm start: register stubs from the cached manifest; the
+                # server isn't spawned until a brain tool actually runs.
+                mcp_tools = [proxy.as_tool(s) for s in cached_schemas]
                 self.notify(
-                    f"brain-mcp connected ({len(mcp_tools)} tools)",
+                    f"brain-mcp tools loaded from cache ({len(mcp_tools)} tools)",
                     timeout=3,
                 )
-            except Exception as exc:
+            else:
+                # Cold start (no valid cache): one full listing, reusing
+                # the proxy's connection for subsequent dispatch.
+                mcp_tools = await proxy.list_tools()
+                mcp.write_cache(_TOOL_CACHE, _MCP_SERVERS, mcp_tools)
                 self.notify(
-                    f"brain-mcp failed to connect: {exc}",
-                    severity="warning",
-                    timeout=6,
+                    f"brain-mcp connected ({len(mcp_tools)} tools)",
+                    timeout=3,
                 )
-        else:
+            return mcp_tools
+        except Exception as exc:
             self.notify(
-                "brain-mcp not found in PATH — running without brain tools",
+                f"brain-mcp failed to connect: {exc}",
                 severity="warning",
                 timeout=6,
             )
+            return []
 
-        # --- SQLite checkpointer for persistent history ---
-        from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+    async def _open_checkpointer(self) -> Any:
+        """Open the pooled SQLite checkpointer on the app's exit stack."""
+        from cerebro.checkpoint import PooledSqliteSaver
 
-        checkpointer = await self._exit_stack.enter_async_context(
-            AsyncSqliteSaver.from_conn_string(str(_DB_PATH))
+        return await self._exit_stack.enter_async_context(
+            PooledSqliteSaver.open(str(_DB_PATH))
         )
 
-        self.graph = create_graph(tools, checkpointer=checkpointer)
-
-        # Focus the input now that we're ready
-        self.query_one("#input", Input).focus()
-
     # ------------------------------------------------------------------
     # Input handling
     # ------------------------------------------------------------------
@@ -242,44 +277,73 @@ class ChatApp(App[None]):
 
         full_text = ""
         tool_calls: List[str] = []
+        tool_calls_seen: set[str] = set()  # O(1) membership; list keeps order
+        # Repaint at most ~30fps while streaming; one Textual reflow per
+        # token dominates wall time on long replies.
+        last_paint = 0.0
 
         try:
             config: dict = {"configurable": {"thread_id": self.thread_id}}
             # LangGraph 1.x passes the context_schema instance via context=, not configurable.
-            ctx = AgentContext()
-            async for event in self.graph.astream_events(
-                {"messages": [("human", content)]},
-                config=config,
-                context=ctx,
-                version="v2",
+            ctx = self._ctx
+            # "messages" yields (chunk, metadata) pairs straight from the
+            # model, skipping the per-token event envelope that
+            # astream_events builds; "updates" adds one cheap event per
+            # completed node, which carries the tool-call detection so the
+            # per-token path stays branch-free.
+            # Bounded buffer: if the TUI falls behind (e.g. backgrounded
+            # terminal), the graph stream blocks instead of queueing
+            # unboundedly.
+            async for mode, payload in bounded_stream(
+                self.graph.astream(
+                    {"messages": [("human", content)]},
+                    config=config,
+                    context=ctx,
+                    stream_mode=["messages", "updates"],
+                ),
+                maxsize=1024,
             ):
-                kind = event["event"]
-
-                if kind == "on_tool_start":
-                    tool_name = event.get("name", "tool")
-                    if tool_name not in tool_calls:
-                        tool_calls.append(tool_name)
-                    ai_widget.set_content(full_text, tool_calls=tool_calls, streaming=True)
-                    container.scroll_end(animate=False)
-
-                elif kind == "on_chat_model_stream":
-                    chunk = event.get("data", {}).get("chunk")
-                    if chunk:
-                        chunk_content = getattr(chunk, "content", None)
-                        added = ""
-                        if isinstance(chunk_content, str):
-                            added = chunk_content
-                        elif isinstance(chunk_content, list):
-                            # Anthropic streams content as a list of typed blocks
-                            for block in chunk_content:
-                                if isinstance(block, dict) and block.get("type") == "text":
-                                    added += block.get("text", "")
-                        if added:
-                            full_text += added
-                            ai_widget.set_content(
-                                full_text, tool_calls=tool_calls, streaming=True
-                            )
-                            container.scroll_end(animate=False)
+                if mode == "updates":
+                    for output in payload.values():
+                        for msg in (output or {}).get("messages", ()):
+                            for tool_call in getattr(msg, "tool_calls", None) or ():
+                                tool_name = tool_call.get("name")
+                                if tool_name and tool_name not in tool_calls_seen:
+                                    tool_calls_seen.add(tool_name)
+                                    tool_calls.append(tool_name)
+                                    ai_widget.set_content(
+                                        full_text, tool_calls=tool_calls, streaming=True
+                                    )
+                                    container.scroll_end(animate=False)
+                    continue
+
+                chunk, _meta = payload
+                if isinstance(chunk, ToolMessage):
+                    # Tool output; the call was already shown via "updates".
+                    continue
+
+                # Exact type checks: content is always a plain str or list of
+                # plain dict blocks here, and `type(x) is ...` skips the MRO
+                # walk isinstance pays on every streamed block.
+                chunk_content = getattr(chunk, "content", None)
+                content_type = type(chunk_content)
+                added = ""
+                if content_type is str:
+                    added = chunk_content
+                elif content_type is list:
+                    # Anthropic streams content as a list of typed blocks
+                    for block in chunk_content:
+                        if type(block) is dict and _dict_get(block, "type") == "text":
+                            added += _dict_get(block, "text", "")
+                if added:
+                    full_text += added
+                    now = monotonic()
+                    if now - last_paint > 0.033:
+                        last_paint = now
+                        ai_widget.set_content(
+                            full_text, tool_calls=tool_calls, streaming=True
+                        )
+                        container.scroll_end(animate=False)
 
         except Exception as exc:
             import traceback
@@ -290,7 +354,11 @@ class ChatApp(App[None]):
             ai_widget.set_content(full_text or "(no response)", tool_calls=tool_calls)
         finally:
             container.scroll_end(animate=False)
-            _save_thread_id(self.thread_id)
+            # Thread id rarely changes mid-session; skip the write syscall
+            # after every message when it hasn't.
+            if self.thread_id != self._last_saved_thread_id:
+                _save_thread_id(self.thread_id)
+                self._last_saved_thread_id = self.thread_id
 
     # ------------------------------------------------------------------
     # Actions
@@ -311,6 +379,12 @@ class ChatApp(App[None]):
 def _daily_thread_id() -> str:
     """Return a thread ID scoped to today's date, restored from last session if same day."""
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    return _restore_thread_id(today)
+
+
+@lru_cache(maxsize=1)
+def _restore_thread_id(today: str) -> str:
+    """Read the saved thread for ``today``, hitting disk once per day."""
     daily_id = f"chat-{today}"
 
     if _THREAD_FILE.exists():
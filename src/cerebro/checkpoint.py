@@ -0,0 +1,273 @@
+"""SQLite checkpointing with a single writer and a pool of readers.
+
+AsyncSqliteSaver shares one connection for reads and writes behind an
+internal lock, so concurrent thread_ids (Studio, multiple panes) serialize
+every read behind in-flight checkpoint writes. PooledSqliteSaver routes
+writes through one dedicated connection and reads through a pool of
+read-only connections, with WAL-friendly PRAGMAs applied per connection.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+from collections import OrderedDict
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Sequence, Tuple
+
+import aiosqlite
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+# Marker for a messages channel stored as blob references rather than inline.
+_MSG_REFS_KEY = "__cerebro_msg_refs__"
+
+# LRU bounds (entries) for the in-process caches below. _msg_hashes pins
+# message objects to keep their ids stable, so left unbounded it would hold
+# the whole history in memory; _blob_cache would likewise absorb the entire
+# message_blobs table when listing history across threads.
+_MSG_HASH_CACHE_SIZE = 4096
+_BLOB_CACHE_SIZE = 512
+
+# Applied to every connection; readers skip journal_mode (WAL is a property
+# of the database file and only the writer may set it).
+_WRITER_PRAGMAS = "PRAGMA journal_mode=WAL;"
+_SHARED_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL;"
+    "PRAGMA busy_timeout=5000;"
+    "PRAGMA cache_size=-20000;"
+    "PRAGMA temp_store=MEMORY;"
+)
+
+
+class PooledSqliteSaver(AsyncSqliteSaver):
+    """AsyncSqliteSaver variant with separated read and write paths.
+
+    Writes (aput/aput_writes) go through the single writer connection held
+    by the base class, using IMMEDIATE transactions so the write lock is
+    taken up front. Reads (aget_tuple/alist) check a connection out of a
+    pool of read-only savers, so they never queue behind the writer's lock.
+
+    The messages channel is stored content-addressed: each message is
+    serialized once into the message_blobs sidecar table, keyed by a
+    blake2b hash of its serialized form, and checkpoints store only the
+    list of hashes. Without this, every checkpoint after every node
+    transition re-serializes the full (immutable) history, so total bytes
+    written grow quadratically with conversation length.
+    """
+
+    def __init__(
+        self,
+        writer: aiosqlite.Connection,
+        readers: List[aiosqlite.Connection],
+        *,
+        serde: SerializerProtocol | None = None,
+    ) -> None:
+        """Wrap the writer connection and build the read pool."""
+        super().__init__(writer, serde=serde)
+        self._reader_savers = [AsyncSqliteSaver(conn, serde=serde) for conn in readers]
+        self._reader_pool: asyncio.Queue[AsyncSqliteSaver] = asyncio.Queue()
+        for reader in self._reader_savers:
+            self._reader_pool.put_nowait(reader)
+        # id(msg) -> (msg, hash), LRU-bounded; the strong ref keeps the id
+        # stable, so a recently seen message is never serialized again.
+        self._msg_hashes: OrderedDict[int, Tuple[Any, str]] = OrderedDict()
+        # hash -> (type, bytes), LRU-bounded mirror of message_blobs rows.
+        self._blob_cache: OrderedDict[str, Tuple[str, bytes]] = OrderedDict()
+
+    @classmethod
+    @asynccontextmanager
+    async def open(
+        cls, db_path: str, *, readers: int | None = None
+    ) -> AsyncIterator[PooledSqliteSaver]:
+        """Open the database with one writer and ``readers`` read connections.
+
+        Args:
+            db_path: Path to the SQLite database file.
+            readers: Size of the read pool. Defaults to os.cpu_count().
+
+        Yields:
+            A ready-to-use PooledSqliteSaver; connections are closed on exit.
+        """
+        n_readers = readers or os.cpu_count() or 4
+        async with AsyncExitStack() as stack:
+            writer = await stack.enter_async_context(aiosqlite.connect(db_path))
+            await writer.executescript(_WRITER_PRAGMAS + _SHARED_PRAGMAS)
+            # Implicit transactions open with BEGIN IMMEDIATE, taking the
+            # write lock up front; the base class commits after every
+            # aput/aput_writes, closing the transaction.
+            writer.isolation_level = "IMMEDIATE"
+
+            reader_conns = []
+            for _ in range(n_readers):
+                conn = await stack.enter_async_context(
+                    aiosqlite.connect(f"file:{db_path}?mode=ro", uri=True)
+                )
+                await conn.executescript(_SHARED_PRAGMAS)
+                reader_conns.append(conn)
+
+            saver = cls(writer, reader_conns)
+            # Create tables on the writer now; read-only savers can't run
+            # DDL, so mark them as already set up.
+            await saver.setup()
+            await writer.execute(
+                "CREATE TABLE IF NOT EXISTS message_blobs ("
+                "hash TEXT PRIMARY KEY, type TEXT NOT NULL, data BLOB NOT NULL)"
+            )
+            await writer.commit()
+            for reader in saver._reader_savers:
+                reader.is_setup = True
+            yield saver
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """Fetch a checkpoint via the read pool, expanding message refs."""
+        reader = await self._reader_pool.get()
+        try:
+            return await self._resolve_tuple(await reader.aget_tuple(config), reader)
+        finally:
+            self._reader_pool.put_nowait(reader)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: Dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        """List checkpoints via the read pool, expanding message refs."""
+        reader = await self._reader_pool.get()
+        try:
+            async for item in reader.alist(
+                config, filter=filter, before=before, limit=limit
+            ):
+                yield await self._resolve_tuple(item, reader)
+        finally:
+            self._reader_pool.put_nowait(reader)
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Save a checkpoint, storing messages as content-addressed refs."""
+        values = checkpoint.get("channel_values") or {}
+        messages = values.get("messages")
+        if isinstance(messages, list) and messages:
+            refs = await self._store_messages(messages)
+            checkpoint = {
+                **checkpoint,
+                "channel_values": {**values, "messages": {_MSG_REFS_KEY: refs}},
+            }
+        return await super().aput(config, checkpoint, metadata, new_versions)
+
+    # ------------------------------------------------------------------
+    # Message blob store
+    # ------------------------------------------------------------------
+
+    def _remember_msg(self, msg: Any, blob_hash: str) -> None:
+        self._msg_hashes[id(msg)] = (msg, blob_hash)
+        self._msg_hashes.move_to_end(id(msg))
+        if len(self._msg_hashes) > _MSG_HASH_CACHE_SIZE:
+            self._msg_hashes.popitem(last=False)
+
+    def _cache_blob(self, blob_hash: str, entry: Tuple[str, bytes]) -> None:
+        self._blob_cache[blob_hash] = entry
+        self._blob_cache.move_to_end(blob_hash)
+        if len(self._blob_cache) > _BLOB_CACHE_SIZE:
+            self._blob_cache.popitem(last=False)
+
+    async def _store_messages(self, messages: Sequence[Any]) -> List[str]:
+        """Write any unseen messages to the blob table; return their hashes."""
+        refs: List[str] = []
+        new_rows: List[Tuple[str, str, bytes]] = []
+        for msg in messages:
+            cached = self._msg_hashes.get(id(msg))
+            if cached is not None and cached[0] is msg:
+                self._msg_hashes.move_to_end(id(msg))
+                refs.append(cached[1])
+                continue
+            type_, data = self.serde.dumps_typed(msg)
+            blob_hash = hashlib.blake2b(data, digest_size=16).hexdigest()
+            self._remember_msg(msg, blob_hash)
+            if blob_hash not in self._blob_cache:
+                self._cache_blob(blob_hash, (type_, data))
+                # INSERT OR IGNORE below makes a re-write of an evicted
+                # (already stored) blob harmless.
+                new_rows.append((blob_hash, type_, data))
+            refs.append(blob_hash)
+        if new_rows:
+            async with self.lock:
+                await self.conn.executemany(
+                    "INSERT OR IGNORE INTO message_blobs (hash, type, data) "
+                    "VALUES (?, ?, ?)",
+                    new_rows,
+                )
+                await self.conn.commit()
+        return refs
+
+    async def _resolve_tuple(
+        self, item: CheckpointTuple | None, reader: AsyncSqliteSaver
+    ) -> CheckpointTuple | None:
+        """Expand message refs in a checkpoint back into message objects."""
+        if item is None:
+            return None
+        values = (item.checkpoint or {}).get("channel_values") or {}
+        messages = values.get("messages")
+        if not (isinstance(messages, dict) and _MSG_REFS_KEY in messages):
+            return item
+        resolved = await self._load_messages(messages[_MSG_REFS_KEY], reader)
+        checkpoint = {
+            **item.checkpoint,
+            "channel_values": {**values, "messages": resolved},
+        }
+        return CheckpointTuple(
+            item.config,
+            checkpoint,
+            item.metadata,
+            item.parent_config,
+            item.pending_writes,
+        )
+
+    async def _load_messages(
+        self, hashes: Sequence[str], reader: AsyncSqliteSaver
+    ) -> List[Any]:
+        # Assemble from a local dict so LRU eviction during a batch larger
+        # than the cache bound can't drop a blob before it is used.
+        blobs: Dict[str, Tuple[str, bytes]] = {}
+        missing: List[str] = []
+        for blob_hash in hashes:
+            entry = self._blob_cache.get(blob_hash)
+            if entry is not None:
+                self._blob_cache.move_to_end(blob_hash)
+                blobs[blob_hash] = entry
+            else:
+                missing.append(blob_hash)
+        if missing:
+            placeholders = ",".join("?" * len(missing))
+            async with reader.conn.execute(
+                f"SELECT hash, type, data FROM message_blobs "
+                f"WHERE hash IN ({placeholders})",
+                missing,
+            ) as cur:
+                async for blob_hash, type_, data in cur:
+                    blobs[blob_hash] = (type_, data)
+                    self._cache_blob(blob_hash, (type_, data))
+        resolved = []
+        for blob_hash in hashes:
+            msg = self.serde.loads_typed(blobs[blob_hash])
+            # Remember the hash of the revived object so re-checkpointing
+            # it later is a cache hit, not a re-serialization.
+            self._remember_msg(msg, blob_hash)
+            resolved.append(msg)
+        return resolved
@@ -30,8 +30,14 @@ class Context:
 
     def __post_init__(self) -> None:
         """Override defaults with matching uppercase environment variables."""
-        for f in fields(self):
-            if not f.init:
-                continue
-            if getattr(self, f.name) == f.default:
-                setattr(self, f.name, os.environ.get(f.name.upper(), f.default))
+        for name, env_name, default in _INIT_FIELDS:
+            if getattr(self, name) == default:
+                setattr(self, name, os.environ.get(env_name, default))
+
+
+# Computed once at import: fields() rebuilds its tuple on every call, and
+# Context is instantiated on the per-message hot path. The environment is
+# still read live so overrides set after import take effect.
+_INIT_FIELDS = tuple(
+    (f.name, f.name.upper(), f.default) for f in fields(Context) if f.init
+)
@@ -1,5 +1,6 @@
 """LangGraph ReAct agent for Cerebro."""
 
+import sys
 from datetime import UTC, datetime
 from typing import Any, Dict, List, Literal, Optional, cast
 
@@ -10,8 +11,9 @@ from langgraph.prebuilt import ToolNode
 from langgraph.runtime import Runtime
 
 from cerebro.context import Context
+from cerebro.prompts import render_system_prompt
 from cerebro.state import InputState, State
-from cerebro.tools import BASE_TOOLS
+from cerebro.tools import BASE_TOOLS, offload_large_tool_results
 from cerebro.utils import load_chat_model
 
 
@@ -33,13 +35,22 @@ def create_graph(
     if tools is None:
         tools = BASE_TOOLS
 
+    # Bound models cached per model name: constructing the client and
+    # regenerating tool schemas on every ReAct step is pure overhead since
+    # the tool set is fixed once the graph is compiled.
+    bound_models: Dict[str, Any] = {}
+
     async def call_model(
         state: State, runtime: Runtime[Context]
     ) -> Dict[str, List[AIMessage]]:
-        model = load_chat_model(runtime.context.model).bind_tools(tools)
-
-        system_message = runtime.context.system_prompt.format(
-            system_time=datetime.now(tz=UTC).isoformat()
+        model_name = runtime.context.model
+        model = bound_models.get(model_name)
+        if model is None:
+            model = load_chat_model(model_name).bind_tools(tools)
+            bound_models[model_name] = model
+
+        system_message = render_system_prompt(
+            runtime.context.system_prompt, datetime.now(tz=UTC).isoformat()
         )
 
         response = cast(
@@ -61,19 +72,37 @@ def create_graph(
 
         return {"messages": [response]}
 
+    # Interned routing literals and a local class ref, captured by the
+    # closure: the router runs on every graph step, so skip the
+    # module-global lookups and the isinstance MRO walk on the common path.
+    _end = sys.intern("__end__")
+    _tools = sys.intern("tools")
+    _ai_message = AIMessage
+
     def route_model_output(state: State) -> Literal["__end__", "tools"]:
         last_message = state.messages[-1]
-        if not isinstance(last_message, AIMessage):
+        if last_message.__class__ is not _ai_message and not isinstance(
+            last_message, _ai_message
+        ):
             raise ValueError(
                 f"Expected AIMessage in output edges, but got {type(last_message).__name__}"
             )
         if not last_message.tool_calls:
-            return "__end__"
-        return "tools"
+            return _end
+        return _tools
+
+    tool_node = ToolNode(tools)
+
+    async def run_tools(state: State) -> Dict[str, List[Any]]:
+        result = await tool_node.ainvoke({"messages": state.messages})
+        # Large outputs are swapped for on-disk refs before they enter
+        # the message history (and with it every later LLM call).
+        offload_large_tool_results(result["messages"])
+        return result
 
     builder = StateGraph(State, input_schema=InputState, context_schema=Context)
     builder.add_node(call_model)
-    builder.add_node("tools", ToolNode(tools))
+    builder.add_node("tools", run_tools)
     builder.add_edge("__start__", "call_model")
     builder.add_conditional_edges("call_model", route_model_output)
     builder.add_edge("tools", "call_model")
@@ -0,0 +1,141 @@
+"""MCP tool-manifest caching.
+
+Listing tools from brain-mcp means spawning the server and completing a
+full stdio handshake, which dominates TUI startup time. The tool manifest
+changes rarely, so it is cached on disk keyed by a hash of the server
+config with a TTL, and re-listed only on a miss. Cache hits produce
+lightweight tool stubs that defer the actual MCP connection until a brain
+tool is first invoked.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import orjson
+from langchain_core.tools import BaseTool, StructuredTool
+
+# How long a cached manifest stays valid before a full re-list.
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+def config_hash(server_config: Dict[str, Any]) -> str:
+    """Return a stable hash of the MCP server config."""
+    payload = orjson.dumps(server_config, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def load_cached_schemas(
+    cache_path: Path, server_config: Dict[str, Any]
+) -> List[Dict[str, Any]] | None:
+    """Return cached tool schemas, or None if missing, stale, or config changed."""
+    try:
+        cached = orjson.loads(cache_path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    if cached.get("config_hash") != config_hash(server_config):
+        return None
+    if cached.get("ttl_expiry", 0) < time.time():
+        return None
+    schemas = cached.get("tool_schemas")
+    return schemas if isinstance(schemas, list) else None
+
+
+def write_cache(
+    cache_path: Path, server_config: Dict[str, Any], tools: List[BaseTool]
+) -> None:
+    """Persist the tool manifest so later launches can skip the handshake."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_bytes(
+        orjson.dumps(
+            {
+                "config_hash": config_hash(server_config),
+                "ttl_expiry": time.time() + CACHE_TTL_SECONDS,
+                "tool_schemas": [_schema_of(tool) for tool in tools],
+            }
+        )
+    )
+
+
+def _schema_of(tool: BaseTool) -> Dict[str, Any]:
+    """Extract a JSON-serializable schema from a loaded MCP tool."""
+    args_schema = tool.args_schema
+    if not isinstance(args_schema, dict):
+        # Pydantic model — convert to plain JSON schema for caching.
+        args_schema = args_schema.model_json_schema()
+    return {
+        "name": tool.name,
+        "description": tool.description,
+        "args_schema": args_schema,
+    }
+
+
+class LazyMCPProxy:
+    """Proxy for an MCP server that defers spawning until first use.
+
+    Construction only records the server config; the server process is
+    launched (and its tools resolved) the first time a proxied tool is
+    invoked, or when :meth:`list_tools` is called explicitly. The proxy
+    must be kept alive for the session so connections aren't GC'd.
+    """
+
+    def __init__(
+        self, server_config: Dict[str, Any], cache_path: Path | None = None
+    ) -> None:
+        """Record the server config; no connection is made here."""
+        self._server_config = server_config
+        self._cache_path = cache_path
+        self._spawn_lock = asyncio.Lock()
+        self._client: Any = None
+        self._tools: Dict[str, BaseTool] | None = None
+
+    async def _connect(self) -> Dict[str, BaseTool]:
+        async with self._spawn_lock:
+            if self._tools is None:
+                from langchain_mcp_adapters.client import MultiServerMCPClient
+
+                self._client = MultiServerMCPClient(self._server_config)
+                self._tools = {t.name: t for t in await self._client.get_tools()}
+        return self._tools
+
+    async def list_tools(self) -> List[BaseTool]:
+        """Spawn the server (if needed) and return the real tool objects."""
+        return list((await self._connect()).values())
+
+    def as_tool(self, schema: Dict[str, Any]) -> BaseTool:
+        """Build a tool stub from a cached schema.
+
+        The stub carries the cached name/description/args schema (enough
+        for the model to plan tool calls) but dispatches through
+        :meth:`_connect` so the server only spawns on first invocation.
+        """
+        name = schema["name"]
+
+        async def _call(**kwargs: Any) -> Any:
+            tools = await self._connect()
+            tool = tools.get(name)
+            if tool is None:
+                # The server's tool set changed while the cache was still
+                # valid. Refresh the cache so the next launch is correct and
+                # give the model a readable error instead of a KeyError.
+                if self._cache_path is not None:
+                    write_cache(
+                        self._cache_path, self._server_config, list(tools.values())
+                    )
+                return (
+                    f"Error: tool '{name}' is no longer provided by brain-mcp. "
+                    "The tool cache has been refreshed; restart to pick up the "
+                    "current tool set."
+                )
+            return await tool.ainvoke(kwargs)
+
+        return StructuredTool(
+            name=name,
+            description=schema["description"],
+            args_schema=schema["args_schema"],
+            coroutine=_call,
+        )
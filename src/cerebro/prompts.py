@@ -1,8 +1,25 @@
 """Default prompts used by the agent."""
 
+from functools import lru_cache
+
 SYSTEM_PROMPT = """You are Cerebro, a personal assistant with access to a local knowledge \
 management system called "brain". You can read and write todos, notes, projects, and daily \
 notes through your tools. Help the user stay organised, capture ideas, plan work, and reflect \
 on their progress. Be concise and direct.
 
 System time: {system_time}"""
+
+
+@lru_cache(maxsize=8)
+def _split_template(template: str) -> tuple:
+    return tuple(template.split("{system_time}"))
+
+
+def render_system_prompt(template: str, system_time: str) -> str:
+    """Render a system prompt template with the current time.
+
+    The template is split once per distinct string (cached), so rendering
+    on every LLM call is a join instead of a full str.format field parse.
+    ``{system_time}`` is the only supported placeholder.
+    """
+    return system_time.join(_split_template(template))
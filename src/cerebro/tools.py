@@ -5,12 +5,66 @@ from the brain-mcp MCP server. This module only defines tools that are always
 available regardless of whether brain-mcp is running.
 """
 
-from typing import Any, Callable, List, Optional, cast
+import hashlib
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, cast
 
+import aiohttp
+import orjson
+from langchain_core.messages import BaseMessage
 from langchain_tavily import TavilySearch
+from langchain_tavily._utilities import TAVILY_API_URL, TavilySearchAPIWrapper
 from langgraph.runtime import get_runtime
 
 from cerebro.context import Context
+from cerebro.utils import DATA_DIR
+
+# One HTTP session shared by all Tavily calls: the stock wrapper opens and
+# closes a fresh aiohttp.ClientSession inside every request, paying a new
+# TLS handshake to api.tavily.com per search.
+_http_session: aiohttp.ClientSession | None = None
+
+
+def _shared_session() -> aiohttp.ClientSession:
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=30),
+            connector=aiohttp.TCPConnector(limit_per_host=20),
+        )
+    return _http_session
+
+
+async def aclose_shared_session() -> None:
+    """Close the shared Tavily HTTP session; called on app shutdown."""
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+
+
+class _PooledTavilyWrapper(TavilySearchAPIWrapper):
+    """API wrapper variant that sends requests over the shared session."""
+
+    async def raw_results_async(self, query: str, **kwargs: Any) -> Dict[str, Any]:
+        """Get results from the Tavily Search API over a keep-alive connection."""
+        params: Dict[str, Any] = {"query": query}
+        params.update((k, v) for k, v in kwargs.items() if v is not None)
+        headers = {
+            "Authorization": f"Bearer {self.tavily_api_key.get_secret_value()}",
+            "Content-Type": "application/json",
+            "X-Client-Source": "langchain-tavily",
+        }
+        base_url = self.api_base_url or TAVILY_API_URL
+        async with _shared_session().post(
+            f"{base_url}/search", json=params, headers=headers
+        ) as res:
+            if res.status != 200:
+                raise Exception(f"Error {res.status}: {res.reason}")
+            return cast(Dict[str, Any], orjson.loads(await res.read()))
+
+
+# Tool wrapper cached per max_results value so repeat searches skip the
+# pydantic construction and share the session above.
+_SEARCH_CLIENTS: Dict[Any, TavilySearch] = {}
 
 
 async def web_search(query: str) -> Optional[dict[str, Any]]:
@@ -20,8 +74,65 @@ async def web_search(query: str) -> Optional[dict[str, Any]]:
     brain tools.
     """
     runtime = get_runtime(Context)
-    wrapped = TavilySearch(max_results=runtime.context.max_search_results)
+    max_results = runtime.context.max_search_results
+    wrapped = _SEARCH_CLIENTS.get(max_results)
+    if wrapped is None:
+        wrapped = _SEARCH_CLIENTS.setdefault(
+            max_results,
+            TavilySearch(max_results=max_results, api_wrapper=_PooledTavilyWrapper()),
+        )
     return cast(dict[str, Any], await wrapped.ainvoke({"query": query}))
 
 
-BASE_TOOLS: List[Callable[..., Any]] = [web_search]
+# Tool outputs above this size are stored on disk and replaced by a preview
+# plus a reference, instead of flowing into every subsequent LLM call and
+# checkpoint write.
+_TOOL_RESULT_DIR = DATA_DIR / "tool_results"
+_OFFLOAD_THRESHOLD = 8 * 1024
+_PREVIEW_CHARS = 1024
+_REF_RE = re.compile(r"[0-9a-f]{32}")
+
+
+def offload_large_tool_results(messages: Iterable[BaseMessage]) -> None:
+    """Replace oversized tool outputs with a preview and an on-disk ref.
+
+    A full web_search payload can run to dozens of KB; kept inline it is
+    re-sent as input tokens on every later model call and re-written into
+    every checkpoint. Content over the threshold is written once to a
+    content-addressed file and the message keeps the head of the result
+    plus a ref resolvable via resolve_tool_result.
+    """
+    for msg in messages:
+        if getattr(msg, "name", None) == "resolve_tool_result":
+            # The escape hatch itself: its output is the stored content,
+            # which is over the threshold by construction. Re-offloading it
+            # would hand the model the same truncation notice it resolved.
+            continue
+        content = msg.content
+        if not isinstance(content, str) or len(content) <= _OFFLOAD_THRESHOLD:
+            continue
+        ref = hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+        _TOOL_RESULT_DIR.mkdir(parents=True, exist_ok=True)
+        path = _TOOL_RESULT_DIR / f"{ref}.json"
+        if not path.exists():
+            path.write_text(content)
+        msg.content = (
+            f"{content[:_PREVIEW_CHARS]}\n"
+            f"[... truncated — {len(content)} chars total. Call "
+            f"resolve_tool_result with ref '{ref}' for the full result.]"
+        )
+
+
+async def resolve_tool_result(ref: str) -> str:
+    """Fetch the full content of a previously truncated tool result.
+
+    Use this when an earlier tool result was truncated and the rest of it
+    is needed; pass the ref from the truncation notice.
+    """
+    path = _TOOL_RESULT_DIR / f"{ref}.json"
+    if not _REF_RE.fullmatch(ref) or not path.exists():
+        return f"Error: no stored tool result for ref '{ref}'."
+    return path.read_text()
+
+
+BASE_TOOLS: List[Callable[..., Any]] = [web_search, resolve_tool_result]
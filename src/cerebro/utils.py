@@ -1,9 +1,18 @@
 """Utility helpers."""
 
+import asyncio
+from pathlib import Path
+from typing import AsyncIterator, TypeVar
+
 from langchain.chat_models import init_chat_model
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import BaseMessage
 
+T = TypeVar("T")
+
+# Where Cerebro keeps chat history, caches and offloaded tool results.
+DATA_DIR = Path.home() / ".local" / "share" / "cerebro"
+
 
 def get_message_text(msg: BaseMessage) -> str:
     """Extract plain text from a message regardless of content format."""
@@ -21,3 +30,37 @@ def load_chat_model(fully_specified_name: str) -> BaseChatModel:
     """Load a chat model from a 'provider/model-name' string."""
     provider, model = fully_specified_name.split("/", maxsplit=1)
     return init_chat_model(model, model_provider=provider)
+
+
+async def bounded_stream(
+    source: AsyncIterator[T], maxsize: int = 1024
+) -> AsyncIterator[T]:
+    """Decouple a producer from a slow consumer with a bounded buffer.
+
+    Pumps ``source`` into an asyncio.Queue from a background task. The
+    producer may run ahead of the consumer by at most ``maxsize`` items,
+    after which it blocks — so a slow consumer (e.g. a backgrounded TUI)
+    exerts backpressure on the upstream stream instead of letting events
+    pile up without bound. Memory stays O(maxsize) for the whole run.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+    done = object()
+
+    async def _pump() -> None:
+        try:
+            async for item in source:
+                await queue.put(item)
+        finally:
+            await queue.put(done)
+
+    task = asyncio.create_task(_pump())
+    try:
+        while True:
+            item = await queue.get()
+            if item is done:
+                break
+            yield item
+        # Propagate any exception raised by the producer.
+        await task
+    finally:
+        task.cancel()
@@ -0,0 +1,99 @@
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.base import empty_checkpoint
+
+from cerebro.checkpoint import PooledSqliteSaver
+
+pytestmark = pytest.mark.anyio
+
+
+async def _blob_count(saver) -> int:
+    async with saver.conn.execute("SELECT COUNT(*) FROM message_blobs") as cur:
+        (count,) = await cur.fetchone()
+    return count
+
+
+async def test_put_get_round_trip(tmp_path) -> None:
+    async with PooledSqliteSaver.open(str(tmp_path / "chat.db"), readers=2) as saver:
+        config = {"configurable": {"thread_id": "t1", "checkpoint_ns": ""}}
+        checkpoint = empty_checkpoint()
+
+        saved = await saver.aput(config, checkpoint, {}, {})
+        tup = await saver.aget_tuple(saved)
+
+        assert tup is not None
+        assert tup.checkpoint["id"] == checkpoint["id"]
+
+
+async def test_alist_returns_written_checkpoints(tmp_path) -> None:
+    async with PooledSqliteSaver.open(str(tmp_path / "chat.db"), readers=2) as saver:
+        config = {"configurable": {"thread_id": "t1", "checkpoint_ns": ""}}
+        await saver.aput(config, empty_checkpoint(), {}, {})
+        await saver.aput(config, empty_checkpoint(), {}, {})
+
+        tuples = [t async for t in saver.alist(config)]
+        assert len(tuples) == 2
+
+
+async def test_messages_round_trip(tmp_path) -> None:
+    async with PooledSqliteSaver.open(str(tmp_path / "chat.db"), readers=2) as saver:
+        config = {"configurable": {"thread_id": "t1", "checkpoint_ns": ""}}
+        checkpoint = empty_checkpoint()
+        messages = [HumanMessage("hi"), AIMessage("hello!")]
+        checkpoint["channel_values"]["messages"] = messages
+
+        saved = await saver.aput(config, checkpoint, {}, {})
+        tup = await saver.aget_tuple(saved)
+
+        restored = tup.checkpoint["channel_values"]["messages"]
+        assert [m.content for m in restored] == ["hi", "hello!"]
+        assert [type(m) for m in restored] == [HumanMessage, AIMessage]
+
+
+async def test_messages_deduped_across_checkpoints(tmp_path) -> None:
+    async with PooledSqliteSaver.open(str(tmp_path / "chat.db"), readers=2) as saver:
+        config = {"configurable": {"thread_id": "t1", "checkpoint_ns": ""}}
+        history = [HumanMessage("hi"), AIMessage("hello!")]
+
+        first = empty_checkpoint()
+        first["channel_values"]["messages"] = list(history)
+        await saver.aput(config, first, {}, {})
+        assert await _blob_count(saver) == 2
+
+        # Same prior messages plus one new turn: only the new message is
+        # serialized and written.
+        second = empty_checkpoint()
+        second["channel_values"]["messages"] = [*history, HumanMessage("more")]
+        await saver.aput(config, second, {}, {})
+        assert await _blob_count(saver) == 3
+
+
+async def test_caches_stay_bounded(tmp_path, monkeypatch) -> None:
+    from cerebro import checkpoint as cp
+
+    monkeypatch.setattr(cp, "_MSG_HASH_CACHE_SIZE", 2)
+    monkeypatch.setattr(cp, "_BLOB_CACHE_SIZE", 2)
+
+    async with PooledSqliteSaver.open(str(tmp_path / "chat.db"), readers=2) as saver:
+        config = {"configurable": {"thread_id": "t1", "checkpoint_ns": ""}}
+        checkpoint = empty_checkpoint()
+        messages = [HumanMessage(f"msg {i}") for i in range(5)]
+        checkpoint["channel_values"]["messages"] = messages
+
+        saved = await saver.aput(config, checkpoint, {}, {})
+        assert len(saver._msg_hashes) <= 2
+        assert len(saver._blob_cache) <= 2
+
+        # Round trip still works even though most blobs were evicted.
+        tup = await saver.aget_tuple(saved)
+        restored = tup.checkpoint["channel_values"]["messages"]
+        assert [m.content for m in restored] == [f"msg {i}" for i in range(5)]
+        assert len(saver._msg_hashes) <= 2
+        assert len(saver._blob_cache) <= 2
+
+
+async def test_wal_mode_enabled(tmp_path) -> None:
+    async with PooledSqliteSaver.open(str(tmp_path / "chat.db"), readers=1) as saver:
+        async with saver.conn.execute("PRAGMA journal_mode") as cur:
+            (mode,) = await cur.fetchone()
+        assert mode == "wal"
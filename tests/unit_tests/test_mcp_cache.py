@@ -0,0 +1,79 @@
+import json
+import time
+
+import pytest
+from langchain_core.tools import StructuredTool
+
+from cerebro import mcp
+
+SERVERS = {
+    "local-brain": {"transport": "stdio", "command": "brain-mcp", "args": []}
+}
+
+
+def _dummy_tool() -> StructuredTool:
+    async def noop(text: str) -> str:
+        return text
+
+    return StructuredTool(
+        name="add_todo",
+        description="Add a todo item.",
+        args_schema={
+            "type": "object",
+            "properties": {"text": {"type": "string"}},
+            "required": ["text"],
+        },
+        coroutine=noop,
+    )
+
+
+def test_cache_miss_on_missing_file(tmp_path) -> None:
+    assert mcp.load_cached_schemas(tmp_path / "mcp_tools.json", SERVERS) is None
+
+
+def test_cache_round_trip(tmp_path) -> None:
+    cache_path = tmp_path / "mcp_tools.json"
+    mcp.write_cache(cache_path, SERVERS, [_dummy_tool()])
+
+    schemas = mcp.load_cached_schemas(cache_path, SERVERS)
+    assert schemas is not None
+    assert schemas[0]["name"] == "add_todo"
+
+    proxy = mcp.LazyMCPProxy(SERVERS)
+    tools = [proxy.as_tool(s) for s in schemas]
+    assert [t.name for t in tools] == ["add_todo"]
+
+
+def test_cache_miss_on_config_change(tmp_path) -> None:
+    cache_path = tmp_path / "mcp_tools.json"
+    mcp.write_cache(cache_path, SERVERS, [_dummy_tool()])
+
+    other = {"local-brain": {"transport": "stdio", "command": "other", "args": []}}
+    assert mcp.load_cached_schemas(cache_path, other) is None
+
+
+def test_cache_miss_on_expired_ttl(tmp_path) -> None:
+    cache_path = tmp_path / "mcp_tools.json"
+    mcp.write_cache(cache_path, SERVERS, [_dummy_tool()])
+
+    cached = json.loads(cache_path.read_text())
+    cached["ttl_expiry"] = time.time() - 1
+    cache_path.write_text(json.dumps(cached))
+
+    assert mcp.load_cached_schemas(cache_path, SERVERS) is None
+
+
+@pytest.mark.anyio
+async def test_stale_cached_tool_refreshes_cache(tmp_path) -> None:
+    cache_path = tmp_path / "mcp_tools.json"
+    removed = _dummy_tool()
+    mcp.write_cache(cache_path, SERVERS, [removed])
+
+    proxy = mcp.LazyMCPProxy(SERVERS, cache_path=cache_path)
+    # Simulate an already-connected server that no longer offers the tool.
+    proxy._tools = {}
+    stub = proxy.as_tool(mcp._schema_of(removed))
+
+    result = await stub.coroutine()
+    assert "no longer provided" in result
+    assert mcp.load_cached_schemas(cache_path, SERVERS) == []
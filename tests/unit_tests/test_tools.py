@@ -0,0 +1,67 @@
+import re
+
+import pytest
+from langchain_core.messages import ToolMessage
+
+from cerebro import tools
+
+
+@pytest.fixture
+def result_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(tools, "_TOOL_RESULT_DIR", tmp_path)
+    return tmp_path
+
+
+def test_small_results_kept_inline(result_dir) -> None:
+    msg = ToolMessage(content="short result", tool_call_id="1")
+    tools.offload_large_tool_results([msg])
+    assert msg.content == "short result"
+    assert list(result_dir.iterdir()) == []
+
+
+def test_large_result_offloaded(result_dir) -> None:
+    full = "x" * (tools._OFFLOAD_THRESHOLD + 1)
+    msg = ToolMessage(content=full, tool_call_id="1")
+    tools.offload_large_tool_results([msg])
+
+    assert len(msg.content) < len(full)
+    assert "truncated" in msg.content
+    (stored,) = result_dir.iterdir()
+    assert stored.read_text() == full
+
+
+def test_resolved_results_never_reoffloaded(result_dir) -> None:
+    full = "z" * (tools._OFFLOAD_THRESHOLD + 1)
+    msg = ToolMessage(
+        content=full, tool_call_id="1", name="resolve_tool_result"
+    )
+    tools.offload_large_tool_results([msg])
+    assert msg.content == full
+
+
+@pytest.mark.anyio
+async def test_resolve_tool_result_round_trip(result_dir) -> None:
+    full = "y" * (tools._OFFLOAD_THRESHOLD + 1)
+    msg = ToolMessage(content=full, tool_call_id="1")
+    tools.offload_large_tool_results([msg])
+
+    match = re.search(r"ref '([0-9a-f]{32})'", msg.content)
+    assert match is not None
+    assert await tools.resolve_tool_result(match.group(1)) == full
+
+
+@pytest.mark.anyio
+async def test_resolve_tool_result_unknown_ref(result_dir) -> None:
+    assert "Error" in await tools.resolve_tool_result("0" * 32)
+    assert "Error" in await tools.resolve_tool_result("../etc/passwd")
+
+
+@pytest.mark.anyio
+async def test_shared_session_reused_until_closed() -> None:
+    first = tools._shared_session()
+    assert tools._shared_session() is first
+
+    await tools.aclose_shared_session()
+    second = tools._shared_session()
+    assert second is not first
+    await tools.aclose_shared_session()
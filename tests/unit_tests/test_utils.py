@@ -0,0 +1,25 @@
+import pytest
+
+from cerebro.utils import bounded_stream
+
+pytestmark = pytest.mark.anyio
+
+
+async def _produce(n: int):
+    for i in range(n):
+        yield i
+
+
+async def test_bounded_stream_preserves_order() -> None:
+    items = [i async for i in bounded_stream(_produce(100), maxsize=4)]
+    assert items == list(range(100))
+
+
+async def test_bounded_stream_propagates_errors() -> None:
+    async def failing():
+        yield 1
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        async for _ in bounded_stream(failing(), maxsize=4):
+            pass